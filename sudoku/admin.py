@@ -69,6 +69,9 @@ class SudokuPuzzleAdmin(admin.ModelAdmin):
     # Number of records per page (performance optimization)
     list_per_page = 25
     
+    # Skip the extra unfiltered COUNT(*) over the whole table on filtered views
+    show_full_result_count = False
+    
     # =============================================================================
     # CUSTOM FIELD FORMATTERS
     # =============================================================================
@@ -297,6 +300,9 @@ class PuzzleResultAdmin(admin.ModelAdmin):
     # Pagination for performance
     list_per_page = 20
     
+    # Skip the extra unfiltered COUNT(*) over the whole table on filtered views
+    show_full_result_count = False
+    
     # =============================================================================
     # CUSTOM FIELD FORMATTERS
     # =============================================================================
@@ -12,3 +12,23 @@ class SudokuConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     # Application name used by Django
     name = "sudoku"
+
+    def ready(self):
+        """
+        Start the background writer for the JSON application logs and warm
+        the URL resolver.
+
+        Building the resolver imports the URLconf (and with it the views and
+        admin URLs) and fills its reverse lookup tables, work that would
+        otherwise land on each worker's first request. Admin autodiscovery
+        has already run by now, since django.contrib.admin precedes this app
+        in INSTALLED_APPS.
+        """
+        from django.urls import get_resolver
+
+        from .utils import start_json_log_listener
+
+        start_json_log_listener()
+
+        # Populates url_patterns (including sudoku.urls) and the reverse map
+        get_resolver().reverse_dict
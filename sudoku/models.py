@@ -258,6 +258,10 @@ class SudokuPuzzle(models.Model):
         indexes = [
             models.Index(fields=['session_id_hash', 'start_time']),
             models.Index(fields=['difficulty', 'start_time']),
+            # Active-puzzle health metric: range on start_time, anti-join key
+            # and distinct sessions all read from the index alone
+            # (also serves the per-day created counts)
+            models.Index(fields=['start_time', 'trx_id', 'session_id_hash']),
         ]
         # Order by most recent puzzles first
         ordering = ['-start_time']
@@ -356,9 +360,10 @@ class PuzzleResult(models.Model):
     )
     
     # Advanced: Alternative valid solutions
-    alternative_solution = models.TextField(
+    alternative_solution = models.JSONField(
+        null=True,
         blank=True,
-        help_text="JSON serialized alternative valid solution if applicable"
+        help_text="Alternative valid solution grid if applicable (NULL otherwise)"
     )
 
     # =============================================================================
@@ -492,6 +497,10 @@ class PuzzleResult(models.Model):
         indexes = [
             models.Index(fields=['session_id_hash', 'date_completed']),
             models.Index(fields=['difficulty', 'solution_status']),
-            models.Index(fields=['date_completed']),
+            # Recent-player distinct count: range on date, sessions from the index
+            # (also serves plain date_completed lookups and ordering)
+            models.Index(fields=['date_completed', 'session_id_hash']),
+            # Average time of recent successful solves
+            models.Index(fields=['solution_status', 'date_completed']),
         ]
         ordering = ['-date_completed']
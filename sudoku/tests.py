@@ -1,3 +1,394 @@
-from django.test import TestCase
+"""
+Tests for the Sudoku game application: views, solver/generator and logging.
+"""
 
-# Create your tests here.
\ No newline at end of file
+import json
+import logging
+import queue
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import PuzzleResult, SudokuPuzzle
+from .utils import (
+    BOX_INDEX,
+    DroppingQueueHandler,
+    generate_sudoku_with_solution,
+    is_valid_complete_board,
+    solve_sudoku,
+)
+from .views import (
+    HEALTH_CACHE_MAX_AGE,
+    INDEX_STATS_CACHE_KEY,
+    _count_activity_by_day,
+    _local_day_start,
+)
+
+
+# Arto Inkala's "world's hardest" puzzle and the first 17-clue puzzle of
+# Gordon Royle's collection, as row-major strings ("0" = empty)
+HARD_PUZZLE = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+SEVENTEEN_CLUE_PUZZLE = (
+    "000000010400000000020000000000050407008000300001090000300400200050100000000806000"
+)
+
+
+def _grid(cells):
+    """Build a 9x9 list-of-lists grid from an 81-character digit string."""
+    return [[int(cell) for cell in cells[row * 9:row * 9 + 9]] for row in range(9)]
+
+
+def _flat(grid):
+    """Flatten a 9x9 grid into a row-major list of 81 cells."""
+    return [cell for row in grid for cell in row]
+
+
+
+def _start_puzzle(client, difficulty="easy"):
+    """Open a new puzzle; return (puzzle, solution, trx_id) from the session."""
+    client.get(reverse("new_puzzle"), {"difficulty": difficulty})
+    session = client.session
+    return json.loads(session["puzzle"]), json.loads(session["solution"]), session["trx-id"]
+
+
+def _answers(puzzle, solution):
+    """Form fields filling every empty cell of puzzle from solution."""
+    return {
+        f"cell_{row}_{col}": str(solution[row][col])
+        for row in range(9)
+        for col in range(9)
+        if puzzle[row][col] == 0
+    }
+
+class HealthCheckQuickProbeTests(TestCase):
+    """Liveness probes (?quick=1) must work without any authentication."""
+
+    def test_anonymous_quick_probe_returns_200(self):
+        """An anonymous load balancer probe gets the liveness payload, not a login redirect."""
+        response = self.client.get(reverse("health_check"), {"quick": "1"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.json()["status"], "healthy")
+        self.assertIn("time", response.json())
+
+    def test_anonymous_quick_probe_is_publicly_cacheable(self):
+        """Anonymous quick probes carry the shared-cache headers for proxies/CDNs."""
+        response = self.client.get(reverse("health_check"), {"quick": "1"})
+
+        cache_control = {
+            directive.strip() for directive in response["Cache-Control"].split(",")
+        }
+        self.assertEqual(cache_control, {"public", f"max-age={HEALTH_CACHE_MAX_AGE}"})
+        self.assertIn("Authorization", response["Vary"])
+
+
+
+class HealthCheckAccessTests(TestCase):
+    """The full health check returns metrics to superusers only."""
+
+    def setUp(self):
+        cache.clear()
+
+    def _cache_control(self, response):
+        return {directive.strip() for directive in response["Cache-Control"].split(",")}
+
+    def assertLivenessOnly(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()), {"status", "time"})
+        self.assertEqual(response.json()["status"], "healthy")
+        # Superusers get metrics from the same URL, so shared caches must not store it
+        self.assertEqual(
+            self._cache_control(response), {"private", f"max-age={HEALTH_CACHE_MAX_AGE}"}
+        )
+
+    def test_anonymous_caller_gets_liveness_payload(self):
+        self.assertLivenessOnly(self.client.get(reverse("health_check")))
+
+    def test_regular_user_gets_liveness_payload(self):
+        user = User.objects.create_user("player", password="pw")
+        self.client.force_login(user)
+
+        self.assertLivenessOnly(self.client.get(reverse("health_check")))
+
+    def test_superuser_gets_metrics(self):
+        admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(admin)
+        _start_puzzle(self.client)
+
+        response = self.client.get(reverse("health_check"))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["accessed_by"], "admin")
+        self.assertTrue(payload["user_is_superuser"])
+        self.assertEqual(payload["puzzle_count"], 1)
+        self.assertEqual(len(payload["daily_counts"]), 3)
+        self.assertEqual(payload["active_sessions"]["with_active_puzzles"], 1)
+        self.assertIn("private", self._cache_control(response))
+
+class IndexStatsCacheTests(TestCase):
+    """Homepage statistics are shared through the cache unless a query failed."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_quiet_site_stats_are_cached(self):
+        """No recent players (fallback-looking values) is not an error; the stats are cached."""
+        response = self.client.get(reverse("index"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(cache.get(INDEX_STATS_CACHE_KEY))
+
+    def test_stats_are_not_cached_after_a_query_failure(self):
+        """Fallback values from a failed query are served once, never cached."""
+        with mock.patch.object(
+            SudokuPuzzle.objects, "count", side_effect=DatabaseError("boom")
+        ):
+            response = self.client.get(reverse("index"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(cache.get(INDEX_STATS_CACHE_KEY))
+
+
+class DailyActivityCacheTests(TestCase):
+    """Closed days are counted once and cached; today is always counted live."""
+
+    def setUp(self):
+        cache.clear()
+
+    def _create_puzzle(self, start_time):
+        SudokuPuzzle.objects.create(
+            session_id_hash="activity", trx_id=str(uuid.uuid4()),
+            board="0" * 81, solution="0" * 81, start_time=start_time,
+            difficulty="easy",
+        )
+
+    def test_closed_days_come_from_the_cache(self):
+        today_start = _local_day_start(timezone.now())
+        yesterday_start = today_start - timedelta(days=1)
+        self._create_puzzle(yesterday_start + timedelta(hours=1))
+
+        created_by_day, _ = _count_activity_by_day(today_start)
+        self.assertEqual(created_by_day.get(yesterday_start.date()), 1)
+
+        # A row that lands in a closed day after it was cached is not seen,
+        # while today's activity still is
+        self._create_puzzle(yesterday_start + timedelta(hours=2))
+        self._create_puzzle(today_start + timedelta(minutes=1))
+        created_by_day, _ = _count_activity_by_day(today_start)
+
+        self.assertEqual(created_by_day.get(yesterday_start.date()), 1)
+        self.assertEqual(created_by_day.get(today_start.date()), 1)
+
+
+class DroppingQueueHandlerTests(SimpleTestCase):
+    """The JSON log queue is bounded and overflows by dropping records."""
+
+    def test_full_queue_drops_records_without_raising(self):
+        log_queue = queue.Queue(maxsize=1)
+        handler = DroppingQueueHandler(log_queue)
+        record = logging.LogRecord("json_logger", logging.INFO, __file__, 1, "msg", None, None)
+
+        with mock.patch.object(handler, "handleError") as handle_error:
+            handler.handle(record)
+            handler.handle(record)
+
+        self.assertEqual(log_queue.qsize(), 1)
+        handle_error.assert_not_called()
+
+
+class SolverTests(SimpleTestCase):
+    """solve_sudoku fills solvable grids in place and rejects invalid ones."""
+
+    def assertSolves(self, cells):
+        grid = _grid(cells)
+
+        self.assertTrue(solve_sudoku(None, grid))
+        self.assertTrue(is_valid_complete_board(_flat(grid)))
+        # Every given is kept
+        for index, given in enumerate(cells):
+            if given != "0":
+                self.assertEqual(_flat(grid)[index], int(given))
+
+    def test_solves_hard_puzzle(self):
+        self.assertSolves(HARD_PUZZLE)
+
+    def test_solves_17_clue_puzzle(self):
+        self.assertSolves(SEVENTEEN_CLUE_PUZZLE)
+
+    def test_rejects_conflicting_givens(self):
+        """A duplicate in a row, column or box is unsolvable; the grid is untouched."""
+        # (row, col) receiving a second 8, clashing with the 8 at (0, 0) only in
+        # its row, its column or its box respectively
+        for unit, (row, col) in {"row": (0, 3), "col": (3, 0), "box": (1, 1)}.items():
+            with self.subTest(unit=unit):
+                grid = _grid(HARD_PUZZLE)
+                grid[row][col] = 8
+                before = [cells[:] for cells in grid]
+
+                self.assertFalse(solve_sudoku(None, grid))
+                self.assertEqual(grid, before)
+
+    def test_rejects_malformed_grids(self):
+        out_of_range = _grid(HARD_PUZZLE)
+        out_of_range[0][1] = 10
+        negative = _grid(HARD_PUZZLE)
+        negative[0][1] = -1
+        non_int = _grid(HARD_PUZZLE)
+        non_int[0][1] = "5"
+        short_row = _grid(HARD_PUZZLE)
+        short_row[4] = short_row[4][:8]
+
+        cases = {
+            "8 rows": _grid(HARD_PUZZLE)[:8],
+            "short row": short_row,
+            "digit 10": out_of_range,
+            "negative digit": negative,
+            "non-int cell": non_int,
+        }
+        for name, grid in cases.items():
+            with self.subTest(case=name):
+                self.assertFalse(solve_sudoku(None, grid))
+
+
+class GeneratorTests(SimpleTestCase):
+    """Generated puzzles come with a valid solution they were cut from."""
+
+    def test_generated_solution_is_valid_and_matches_puzzle(self):
+        for empty_cells in (30, 40, 50):
+            with self.subTest(empty_cells=empty_cells):
+                puzzle, solution = generate_sudoku_with_solution(None, empty_cells)
+
+                self.assertTrue(is_valid_complete_board(_flat(solution)))
+                self.assertEqual(_flat(puzzle).count(0), empty_cells)
+                for given, solved in zip(_flat(puzzle), _flat(solution)):
+                    if given:
+                        self.assertEqual(given, solved)
+
+                # The puzzle itself is solvable
+                self.assertTrue(solve_sudoku(None, puzzle))
+                self.assertTrue(is_valid_complete_board(_flat(puzzle)))
+
+
+class CheckPuzzleTests(TestCase):
+    """Submitting a puzzle through check_puzzle."""
+
+    def _drop_session_keys(self, *keys):
+        session = self.client.session
+        for key in keys:
+            del session[key]
+        session.save()
+
+    def _check(self, data):
+        response = self.client.post(reverse("check_puzzle"), data)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_get_redirects_to_new_puzzle(self):
+        response = self.client.get(reverse("check_puzzle"))
+
+        self.assertRedirects(response, reverse("new_puzzle"), fetch_redirect_response=False)
+
+    def test_correct_submission(self):
+        puzzle, solution, trx_id = _start_puzzle(self.client)
+
+        response = self._check({"trx_id": trx_id, **_answers(puzzle, solution)})
+
+        self.assertTrue(response.context["success"])
+        for row in range(9):
+            for col in range(9):
+                expected = "P" if puzzle[row][col] else "C"
+                self.assertEqual(response.context["user_input_status"][row][col], expected)
+        self.assertEqual(response.context["error_rows"], [])
+        result = PuzzleResult.objects.get(trx_id=trx_id)
+        self.assertTrue(result.solution_status)
+        self.assertIsNone(result.alternative_solution)
+
+    def test_wrong_submission_marks_the_cell_and_its_units(self):
+        puzzle, solution, trx_id = _start_puzzle(self.client)
+        row, col = next((r, c) for r in range(9) for c in range(9) if puzzle[r][c] == 0)
+        data = {"trx_id": trx_id, **_answers(puzzle, solution)}
+        data[f"cell_{row}_{col}"] = str(solution[row][col] % 9 + 1)
+
+        response = self._check(data)
+
+        self.assertFalse(response.context["success"])
+        self.assertEqual(response.context["user_input_status"][row][col], "W")
+        self.assertEqual(response.context["error_rows"], [row])
+        self.assertEqual(response.context["error_cols"], [col])
+        self.assertEqual(response.context["error_boxes"], [BOX_INDEX[row * 9 + col]])
+        self.assertFalse(PuzzleResult.objects.get(trx_id=trx_id).solution_status)
+
+    def test_alternative_valid_solution_is_accepted(self):
+        """A valid grid differing from the stored solution counts as correct."""
+        _, solution, trx_id = _start_puzzle(self.client)
+        # With no givens, relabelling every digit (d -> d % 9 + 1) yields a
+        # different yet valid solution
+        session = self.client.session
+        session["puzzle"] = json.dumps([[0] * 9 for _ in range(9)])
+        session.save()
+        alternative = [[digit % 9 + 1 for digit in row] for row in solution]
+        data = {
+            f"cell_{row}_{col}": str(alternative[row][col])
+            for row in range(9)
+            for col in range(9)
+        }
+
+        response = self._check({"trx_id": trx_id, **data})
+
+        self.assertTrue(response.context["success"])
+        # Every cell differed from the stored solution; all are relabelled W -> C
+        self.assertEqual(response.context["user_input_status"], [["C"] * 9] * 9)
+        result = PuzzleResult.objects.get(trx_id=trx_id)
+        self.assertTrue(result.solution_status)
+        self.assertEqual(result.alternative_solution, alternative)
+
+    def test_missing_session_data_is_recovered_from_the_database(self):
+        puzzle, solution, trx_id = _start_puzzle(self.client)
+        self._drop_session_keys("puzzle", "solution", "puzzle_start_time")
+
+        response = self._check(
+            {"trx_id": trx_id, "timer_value": "00:02:30", **_answers(puzzle, solution)}
+        )
+
+        self.assertTrue(response.context["success"])
+        result = PuzzleResult.objects.get(trx_id=trx_id)
+        self.assertTrue(result.solution_status)
+        # Start time was rebuilt from the posted timer value
+        self.assertAlmostEqual(result.time_taken.total_seconds(), 150, delta=5)
+
+    def test_lone_missing_trx_id_is_restored_from_own_puzzle(self):
+        puzzle, solution, trx_id = _start_puzzle(self.client)
+        self._drop_session_keys("trx-id")
+
+        response = self.client.post(
+            reverse("check_puzzle"), {"trx_id": trx_id, **_answers(puzzle, solution)}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["success"])
+        self.assertTrue(PuzzleResult.objects.filter(trx_id=trx_id).exists())
+
+    def test_lone_missing_trx_id_rejects_unknown_or_malformed_ids(self):
+        """A posted ID naming no puzzle of this session is never trusted."""
+        puzzle, solution, _ = _start_puzzle(self.client)
+
+        for posted in (str(uuid.uuid4()), "not-a-uuid"):
+            with self.subTest(trx_id=posted):
+                self._drop_session_keys("trx-id")
+                self.client.post(
+                    reverse("check_puzzle"), {"trx_id": posted, **_answers(puzzle, solution)}
+                )
+
+                self.assertFalse(PuzzleResult.objects.filter(trx_id=posted).exists())
+                self.assertNotEqual(self.client.session.get("trx-id"), posted)
@@ -25,13 +25,16 @@ License: MIT
 
 import random
 import json
+import orjson
 import uuid
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import queue
+import atexit
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 from django.utils import timezone
 import socket
 import os
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Sequence
 from django.http import HttpRequest
 from django.conf import settings
 
@@ -46,6 +49,21 @@ is_production = getattr(settings, "IS_PRODUCTION", False)
 GRID_SIZE = 9           # Standard 9x9 Sudoku grid
 SUBGRID_SIZE = 3        # 3x3 subgrid size within the main grid
 
+# Bit mask with one bit per digit 1-9 (bit k set = digit k+1)
+FULL_DIGIT_MASK = (1 << GRID_SIZE) - 1
+
+# 3x3 box number (0-8) of every cell, indexed by row * GRID_SIZE + col
+# Stored as bytes so indexing returns a plain int without any arithmetic
+BOX_INDEX = bytes(
+    (row // SUBGRID_SIZE) * SUBGRID_SIZE + (col // SUBGRID_SIZE)
+    for row in range(GRID_SIZE)
+    for col in range(GRID_SIZE)
+)
+
+# Row and column number (0-8) of every cell, laid out like BOX_INDEX
+ROW_INDEX = bytes(row for row in range(GRID_SIZE) for _ in range(GRID_SIZE))
+COL_INDEX = bytes(col for _ in range(GRID_SIZE) for col in range(GRID_SIZE))
+
 # Difficulty level configuration
 # Maps difficulty names to (min_empty_cells, max_empty_cells) ranges
 DIFFICULTY_LEVELS = {
@@ -135,7 +153,8 @@ def is_valid_complete_grid(grid: List[List[int]]) -> bool:
     4. Column uniqueness: Each column contains digits 1-9 exactly once
     5. Subgrid uniqueness: Each 3x3 box contains digits 1-9 exactly once
     
-    Algorithm Complexity: O(81) - examines each cell exactly once
+    Algorithm Complexity: O(81) - examines each cell exactly once, in a
+    single pass that checks rows, columns and boxes together
     
     Args:
         grid (List[List[int]]): 9x9 grid to validate
@@ -156,34 +175,46 @@ def is_valid_complete_grid(grid: List[List[int]]) -> bool:
     if len(grid) != GRID_SIZE or any(len(row) != GRID_SIZE for row in grid):
         return False
 
-    # Value range validation
-    if any(not all(1 <= cell <= 9 for cell in row) for row in grid):
+    return is_valid_complete_board([cell for row in grid for cell in row])
+
+
+def is_valid_complete_board(board: Sequence[int]) -> bool:
+    """
+    Validate a completed Sudoku stored as a flat, row-major 81-cell board.
+    
+    Flat counterpart of is_valid_complete_grid() for callers that already
+    keep the grid in one sequence (e.g. a bytearray), so no rows have to
+    be built just for validation.
+    
+    Args:
+        board (Sequence[int]): 81 digits in row-major order
+        
+    Returns:
+        bool: True if board is a valid complete Sudoku solution
+    """
+    if len(board) != GRID_SIZE * GRID_SIZE:
         return False
 
-    # Row uniqueness validation
-    # Each row must contain exactly the numbers 1-9 (no duplicates, no missing)
-    for row in grid:
-        if len(set(row)) != GRID_SIZE:
+    # Single pass over all cells: each row, column and box keeps a 9-bit
+    # mask of the digits seen so far. With 81 in-range digits and no digit
+    # repeated within any unit, every unit necessarily holds 1-9 exactly once.
+    row_masks = [0] * GRID_SIZE
+    col_masks = [0] * GRID_SIZE
+    box_masks = [0] * GRID_SIZE
+    for idx, cell in enumerate(board):
+        # Value range validation
+        if not 1 <= cell <= 9:
             return False
-
-    # Column uniqueness validation
-    for col in range(GRID_SIZE):
-        column = [grid[row][col] for row in range(GRID_SIZE)]
-        if len(set(column)) != GRID_SIZE:
+        bit = 1 << (cell - 1)
+        row = ROW_INDEX[idx]
+        col = COL_INDEX[idx]
+        box = BOX_INDEX[idx]
+        # Row, column and 3x3 subgrid uniqueness validation
+        if (row_masks[row] | col_masks[col] | box_masks[box]) & bit:
             return False
-
-    # 3x3 subgrid uniqueness validation
-    for box_row in range(0, GRID_SIZE, SUBGRID_SIZE):
-        for box_col in range(0, GRID_SIZE, SUBGRID_SIZE):
-            # Extract all numbers from the current 3x3 box
-            box = []
-            for r in range(box_row, box_row + SUBGRID_SIZE):
-                for c in range(box_col, box_col + SUBGRID_SIZE):
-                    box.append(grid[r][c])
-            
-            # Verify the box contains exactly digits 1-9
-            if len(set(box)) != GRID_SIZE:
-                return False
+        row_masks[row] |= bit
+        col_masks[col] |= bit
+        box_masks[box] |= bit
 
     return True
 
@@ -191,6 +222,108 @@ def is_valid_complete_grid(grid: List[List[int]]) -> bool:
 # SUDOKU SOLVING ALGORITHM
 # =============================================================================
 
+def _solve_core(board: List[int]) -> bool:
+    """
+    Backtracking solver core working on a flat, row-major 81-cell board.
+    
+    Each row, column and box keeps a 9-bit mask of the digits it already
+    holds (bit k set = digit k+1 placed), so the candidates for a cell are
+    a single expression: ~(row | col | box) & FULL_DIGIT_MASK. At every step
+    the empty cell with the fewest candidates is filled next (minimum
+    remaining values), and a branch is abandoned as soon as some unit has
+    a missing digit that no empty cell can take. Together these prune dead
+    branches early and let unsolvable grids fail fast.
+    
+    Args:
+        board (List[int]): 81 digits, 0 for empty cells (modified in-place)
+        
+    Returns:
+        bool: True if the board was completed, False if it has no solution
+        (the board is left unchanged in that case)
+    """
+    row_masks = [0] * GRID_SIZE
+    col_masks = [0] * GRID_SIZE
+    box_masks = [0] * GRID_SIZE
+    empty_cells = []
+
+    for idx, value in enumerate(board):
+        row = ROW_INDEX[idx]
+        col = COL_INDEX[idx]
+        box = BOX_INDEX[idx]
+        if value:
+            bit = 1 << (value - 1)
+            # Conflicting givens can never be completed into a solution
+            if (row_masks[row] | col_masks[col] | box_masks[box]) & bit:
+                return False
+            row_masks[row] |= bit
+            col_masks[col] |= bit
+            box_masks[box] |= bit
+        else:
+            empty_cells.append((idx, row, col, box))
+
+    def fill(depth: int) -> bool:
+        # Cells before depth are filled; all filled means solution found!
+        if depth == len(empty_cells):
+            return True
+
+        # Pick the remaining empty cell with the fewest candidate digits,
+        # while collecting which digits each unit can still place somewhere
+        best_pos = depth
+        best_candidates = 0
+        best_count = GRID_SIZE + 1
+        row_cover = [0] * GRID_SIZE
+        col_cover = [0] * GRID_SIZE
+        box_cover = [0] * GRID_SIZE
+        for pos in range(depth, len(empty_cells)):
+            _, row, col, box = empty_cells[pos]
+            candidates = ~(row_masks[row] | col_masks[col] | box_masks[box]) & FULL_DIGIT_MASK
+            # A cell with no candidates means this branch cannot be completed
+            if not candidates:
+                return False
+            row_cover[row] |= candidates
+            col_cover[col] |= candidates
+            box_cover[box] |= candidates
+            count = candidates.bit_count()
+            if count < best_count:
+                best_pos, best_candidates, best_count = pos, candidates, count
+
+        # Every digit a unit is still missing needs at least one cell to go
+        # in; otherwise this branch is dead even if each cell has candidates
+        for unit in range(GRID_SIZE):
+            if (~row_masks[unit] & ~row_cover[unit] & FULL_DIGIT_MASK
+                    or ~col_masks[unit] & ~col_cover[unit] & FULL_DIGIT_MASK
+                    or ~box_masks[unit] & ~box_cover[unit] & FULL_DIGIT_MASK):
+                return False
+
+        # Move the chosen cell to the current depth for the recursion
+        empty_cells[depth], empty_cells[best_pos] = empty_cells[best_pos], empty_cells[depth]
+        idx, row, col, box = empty_cells[depth]
+
+        candidates = best_candidates
+        while candidates:
+            # Take the lowest candidate bit and place its digit
+            bit = candidates & -candidates
+            candidates ^= bit
+            board[idx] = bit.bit_length()
+            row_masks[row] |= bit
+            col_masks[col] |= bit
+            box_masks[box] |= bit
+
+            if fill(depth + 1):
+                return True
+
+            # Current path failed - backtrack
+            row_masks[row] ^= bit
+            col_masks[col] ^= bit
+            box_masks[box] ^= bit
+
+        board[idx] = 0
+        empty_cells[depth], empty_cells[best_pos] = empty_cells[best_pos], empty_cells[depth]
+        return False
+
+    return fill(0)
+
+
 def solve_sudoku(request: HttpRequest, grid: List[List[int]]) -> bool:
     """
     Solve a Sudoku puzzle using recursive backtracking algorithm.
@@ -198,13 +331,15 @@ def solve_sudoku(request: HttpRequest, grid: List[List[int]]) -> bool:
     Implements a depth-first search with constraint satisfaction to find
     a valid solution for any solvable Sudoku puzzle. The algorithm:
     
-    1. Finds the first empty cell (0)
-    2. Tries each number 1-9 in that cell
+    1. Finds the empty cell (0) with the fewest possible digits
+    2. Tries each possible digit in that cell
     3. For each valid number, recursively solves the rest of the grid
     4. If no solution found, backtracks and tries next number
     5. Returns True when all cells are filled validly
     
-    The grid is modified in-place with the solution when found.
+    The search itself runs in _solve_core() on a flat copy of the grid;
+    the result is copied back, so the grid is modified in-place with the
+    solution when found and left untouched otherwise.
     
     Algorithm Complexity: O(9^(n*n)) worst case, where n=9
     Practical performance: Much faster due to constraint propagation
@@ -215,6 +350,7 @@ def solve_sudoku(request: HttpRequest, grid: List[List[int]]) -> bool:
         
     Returns:
         bool: True if solution found (grid is modified), False if unsolvable
+        or if the grid is not a 9x9 grid of digits 0-9
         
     Example:
         >>> puzzle = [
@@ -227,28 +363,21 @@ def solve_sudoku(request: HttpRequest, grid: List[List[int]]) -> bool:
         ... else:
         ...     print("No solution exists")
     """
-    # Scan grid left-to-right, top-to-bottom for first empty cell
-    for row in range(GRID_SIZE):
-        for col in range(GRID_SIZE):
-            if grid[row][col] == 0:  # Found empty cell
-                # Try each possible number (1-9) in this cell
-                for num in range(1, GRID_SIZE + 1):
-                    if is_valid(request, grid, row, col, num):
-                        # Place number if it doesn't violate constraints
-                        grid[row][col] = num
-
-                        # Recursively attempt to solve rest of puzzle
-                        if solve_sudoku(request, grid):
-                            return True  # Solution found!
-
-                        # Current path failed - backtrack
-                        # Reset cell and try next number
-                        grid[row][col] = 0
-
-                # No valid number works in this cell - puzzle unsolvable from this state
-                return False
+    # Reject anything that is not a 9x9 grid of digits 0-9
+    if len(grid) != GRID_SIZE or any(len(row) != GRID_SIZE for row in grid):
+        return False
+
+    # Flatten into a single row-major list for the solver core
+    board = [cell for row in grid for cell in row]
+    if any(type(cell) is not int or not 0 <= cell <= GRID_SIZE for cell in board):
+        return False
 
-    # All cells filled successfully - solution found!
+    if not _solve_core(board):
+        return False
+
+    # Copy the solution back into the caller's rows
+    for row in range(GRID_SIZE):
+        grid[row][:] = board[row * GRID_SIZE:(row + 1) * GRID_SIZE]
     return True
 
 
@@ -256,65 +385,75 @@ def solve_sudoku(request: HttpRequest, grid: List[List[int]]) -> bool:
 # SUDOKU PUZZLE GENERATION
 # =============================================================================
 
-def generate_sudoku(request: HttpRequest, empty_cells: int = 40) -> List[List[int]]:
+def generate_sudoku_with_solution(
+    request: HttpRequest, empty_cells: int = 40
+) -> Tuple[List[List[int]], List[List[int]]]:
     """
-    Generate a valid Sudoku puzzle with specified difficulty.
+    Generate a Sudoku puzzle together with the solution it was derived from.
     
     Creates a complete, valid Sudoku solution and then strategically removes
     numbers to create a puzzle with the desired number of empty cells.
+    The completed grid is kept, so callers do not have to solve the puzzle
+    a second time to obtain its solution.
     
     Generation Process:
     1. Create empty 9x9 grid
     2. Seed with random valid numbers to ensure uniqueness
     3. Use backtracking algorithm to complete the solution
-    4. Randomly remove numbers to create puzzle
-    5. Return the puzzle with specified empty cell count
+       (reseeding if the seeds happen to admit no solution)
+    4. Copy the completed grid as the solution
+    5. Randomly remove numbers to create puzzle
     
     The seeding step is crucial for generating diverse puzzles rather than
     similar patterns that might emerge from purely algorithmic generation.
     
-    Performance: Typically completes in <100ms for most difficulty levels
-    
     Args:
         request (HttpRequest): Django request object (for API consistency)
         empty_cells (int): Number of cells to leave empty (default: 40)
         
     Returns:
-        List[List[int]]: 9x9 grid representing the generated puzzle
+        Tuple[List[List[int]], List[List[int]]]: (puzzle, solution) 9x9 grids
         
     Example:
-        >>> puzzle = generate_sudoku(request, empty_cells=45)  # Hard difficulty
-        >>> count_empty = sum(row.count(0) for row in puzzle)
-        >>> print(f"Generated puzzle with {count_empty} empty cells")
+        >>> puzzle, solution = generate_sudoku_with_solution(request, 45)
+        >>> is_valid_complete_grid(solution)
+        True
     """
-    # Initialize empty 9x9 grid
-    grid = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-
-    # Seed the grid with random valid numbers for diversity
-    # 11 seeds provide good balance between randomness and solve time
-    seed_count = 11
-    for _ in range(seed_count):
-        # Generate random position and number
-        row = random.randint(0, GRID_SIZE - 1)
-        col = random.randint(0, GRID_SIZE - 1) 
-        num = random.randint(1, GRID_SIZE)
-
-        # Find valid placement for this number
-        # Keep trying until we find an empty cell where this number is valid
-        attempts = 0
-        while (not is_valid(request, grid, row, col, num) or 
-               grid[row][col] != 0) and attempts < 100:
+    # Seeds are checked one at a time, so together they can occasionally
+    # leave the grid unsolvable; start over with fresh seeds in that case
+    while True:
+        # Initialize empty 9x9 grid
+        grid = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+
+        # Seed the grid with random valid numbers for diversity
+        # 11 seeds provide good balance between randomness and solve time
+        seed_count = 11
+        for _ in range(seed_count):
+            # Generate random position and number
             row = random.randint(0, GRID_SIZE - 1)
-            col = random.randint(0, GRID_SIZE - 1)
+            col = random.randint(0, GRID_SIZE - 1) 
             num = random.randint(1, GRID_SIZE)
-            attempts += 1
 
-        # Place the valid seed number
-        if attempts < 100:  # Avoid infinite loops
-            grid[row][col] = num
+            # Find valid placement for this number
+            # Keep trying until we find an empty cell where this number is valid
+            attempts = 0
+            while (not is_valid(request, grid, row, col, num) or 
+                   grid[row][col] != 0) and attempts < 100:
+                row = random.randint(0, GRID_SIZE - 1)
+                col = random.randint(0, GRID_SIZE - 1)
+                num = random.randint(1, GRID_SIZE)
+                attempts += 1
+
+            # Place the valid seed number
+            if attempts < 100:  # Avoid infinite loops
+                grid[row][col] = num
 
-    # Solve the seeded grid to get a complete valid solution
-    solve_sudoku(request, grid)
+        # Solve the seeded grid to get a complete valid solution
+        if solve_sudoku(request, grid):
+            break
+
+    # Keep the completed grid as the puzzle's solution
+    solution = [row[:] for row in grid]
 
     # Create puzzle by removing numbers
     # Generate list of all filled positions
@@ -327,7 +466,29 @@ def generate_sudoku(request: HttpRequest, empty_cells: int = 40) -> List[List[in
     for r, c in filled_positions[:empty_cells]:
         grid[r][c] = 0
 
-    return grid
+    return grid, solution
+
+
+def generate_sudoku(request: HttpRequest, empty_cells: int = 40) -> List[List[int]]:
+    """
+    Generate a valid Sudoku puzzle with specified difficulty.
+    
+    Convenience wrapper around generate_sudoku_with_solution() for callers
+    that only need the puzzle grid.
+    
+    Args:
+        request (HttpRequest): Django request object (for API consistency)
+        empty_cells (int): Number of cells to leave empty (default: 40)
+        
+    Returns:
+        List[List[int]]: 9x9 grid representing the generated puzzle
+        
+    Example:
+        >>> puzzle = generate_sudoku(request, empty_cells=45)  # Hard difficulty
+        >>> count_empty = sum(row.count(0) for row in puzzle)
+        >>> print(f"Generated puzzle with {count_empty} empty cells")
+    """
+    return generate_sudoku_with_solution(request, empty_cells)[0]
 
 
 # =============================================================================
@@ -408,7 +569,30 @@ class JsonLogFilter(logging.Filter):
         return True  # Always allow the log record through
 
 
-def setup_json_logger(is_production: bool = False) -> logging.Logger:
+# Upper bound on records waiting for the listener thread; beyond it new
+# records are dropped instead of growing memory without limit
+JSON_LOG_QUEUE_SIZE = 10000
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue that drops records when it is full.
+    
+    The stock handler reports queue.Full through handleError (a traceback on
+    stderr for every record); during a log burst losing the overflow is
+    preferable to that or to blocking the request thread.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def setup_json_logger(
+    is_production: bool = False,
+) -> Tuple[logging.Logger, QueueListener]:
     """
     Configure a comprehensive JSON logging system with rotation and filtering.
     
@@ -418,6 +602,13 @@ def setup_json_logger(is_production: bool = False) -> logging.Logger:
     - Applies different retention policies for different log levels
     - Includes privacy filtering for production environments
     - Separates debug and info logs for performance optimization
+    - Writes log files from a background thread, off the request path
+    
+    The logger itself only carries a DroppingQueueHandler, so emitting a
+    record is a queue put. The returned QueueListener owns the rotating file
+    handlers and must be started (see start_json_log_listener) for records
+    to reach disk; records queued before that are written once it starts.
+    The queue holds at most JSON_LOG_QUEUE_SIZE records.
     
     Log Files Created:
     - sudoku_app_info.log: INFO+ messages, 30-day retention
@@ -427,10 +618,12 @@ def setup_json_logger(is_production: bool = False) -> logging.Logger:
         is_production (bool): Whether to configure for production environment
         
     Returns:
-        logging.Logger: Configured logger ready for use
+        Tuple[logging.Logger, QueueListener]: Configured logger and the
+        (not yet started) listener that writes its records to the log files
         
     Example:
-        >>> logger = setup_json_logger(is_production=True)
+        >>> logger, listener = setup_json_logger(is_production=True)
+        >>> listener.start()
         >>> logger.info(json.dumps({"event": "user_login", "user_id": 123}))
     """
     # Determine log directory relative to this module
@@ -491,24 +684,92 @@ def setup_json_logger(is_production: bool = False) -> logging.Logger:
     debug_handler.setFormatter(formatter)
     debug_handler.addFilter(privacy_filter)
 
-    # Add handlers to logger
-    logger.addHandler(info_handler)
-    logger.addHandler(debug_handler)
+    # Route records through a bounded queue so file I/O happens on the
+    # listener thread; filters and formatters stay on the file handlers and
+    # run there as well
+    log_queue = queue.Queue(maxsize=JSON_LOG_QUEUE_SIZE)
+    logger.addHandler(DroppingQueueHandler(log_queue))
+    listener = QueueListener(
+        log_queue, info_handler, debug_handler, respect_handler_level=True
+    )
     
     # Prevent propagation to avoid duplicate logs
     logger.propagate = False
 
-    return logger
+    return logger, listener
+
+
+# Initialize the global JSON logger instance and its background writer
+json_logger, json_log_listener = setup_json_logger(is_production)
+
+# Process whose listener thread is running (None until first started)
+_json_log_listener_pid: Optional[int] = None
+
+
+def start_json_log_listener() -> None:
+    """
+    Start the background thread that writes JSON log records to disk.
+    
+    Called from SudokuConfig.ready(). Safe to call more than once per
+    process; the listener is stopped (flushing any queued records) at
+    interpreter exit.
+    
+    Threads do not survive fork(), so a preloading server (e.g. gunicorn
+    --preload, which runs ready() in the master) would leave its workers
+    queueing records nobody writes. When called in a different process
+    than the one that started it, the listener is rebuilt around a fresh
+    queue (the inherited one may still hold the parent's records) and
+    started there; _restart_json_log_listener_after_fork does this
+    automatically in every forked child.
+    """
+    global json_log_listener, _json_log_listener_pid
+    pid = os.getpid()
+    if _json_log_listener_pid == pid:
+        return
+
+    if _json_log_listener_pid is not None:
+        # Forked child: replace the parent's queue and listener
+        atexit.unregister(json_log_listener.stop)
+        log_queue = queue.Queue(maxsize=JSON_LOG_QUEUE_SIZE)
+        for handler in json_logger.handlers:
+            if isinstance(handler, QueueHandler):
+                handler.queue = log_queue
+        json_log_listener = QueueListener(
+            log_queue,
+            *json_log_listener.handlers,
+            respect_handler_level=json_log_listener.respect_handler_level,
+        )
+
+    json_log_listener.start()
+    atexit.register(json_log_listener.stop)
+    _json_log_listener_pid = pid
+
 
+def _restart_json_log_listener_after_fork() -> None:
+    """Give a forked child its own listener if the parent had one running."""
+    if _json_log_listener_pid is not None:
+        start_json_log_listener()
 
-# Initialize the global JSON logger instance
-json_logger = setup_json_logger(is_production)
+
+os.register_at_fork(after_in_child=_restart_json_log_listener_after_fork)
 
 
 # =============================================================================
 # STRUCTURED LOGGING FUNCTIONS
 # =============================================================================
 
+# Host name never changes while the process runs, so resolve it only once
+HOSTNAME = socket.gethostname()
+
+# Numeric logging levels for the level names used by log_to_json
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
 def log_to_json(
     request: Optional[HttpRequest],
     module_name: str,
@@ -559,42 +820,40 @@ def log_to_json(
     # Generate timestamp with millisecond precision for accurate timing
     timestamp = timezone.now().isoformat(timespec="milliseconds")
 
+    # Look up the session once; requests outside the session middleware
+    # (and calls without a request) have none
+    session = getattr(request, "session", None) if request else None
+
     # Extract session information safely
-    session_id = ""
-    if (request and hasattr(request, "session") and 
-        hasattr(request.session, "session_key")):
-        session_id = request.session.session_key or ""
+    session_id = (getattr(session, "session_key", None) or "") if session is not None else ""
 
     # Handle transaction ID generation and persistence
-    if request and request.session.get("trx-id"):
+    session_trx_id = session.get("trx-id") if session is not None else None
+    if session_trx_id:
         # Use existing transaction ID from session
-        transaction_id = request.session.get("trx-id")
+        transaction_id = session_trx_id
     elif not transaction_id:
         # Generate new transaction ID
         transaction_id = str(uuid.uuid4())
         # Store in session if available
-        if request and hasattr(request, "session"):
-            request.session["trx-id"] = transaction_id
+        if session is not None:
+            session["trx-id"] = transaction_id
 
-    # Extract client IP with proxy support
-    client_ip = ""
+    # Extract client IP with proxy support and the request context
+    client_ip = url_path = http_method = user_agent = ""
     if request:
+        meta = request.META
         # Check for forwarded IP (behind proxy/load balancer)
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+        x_forwarded_for = meta.get("HTTP_X_FORWARDED_FOR")
         if x_forwarded_for:
             # Take first IP in chain (original client)
             client_ip = x_forwarded_for.split(",")[0].strip()
         else:
             # Direct connection IP
-            client_ip = request.META.get("REMOTE_ADDR", "")
-
-    # Extract request context
-    url_path = request.path if request else ""
-    http_method = request.method if request else ""
-    user_agent = request.META.get("HTTP_USER_AGENT", "") if request else ""
-
-    # Get system hostname for distributed system tracking
-    hostname = socket.gethostname()
+            client_ip = meta.get("REMOTE_ADDR", "")
+        url_path = request.path
+        http_method = request.method
+        user_agent = meta.get("HTTP_USER_AGENT", "")
 
     # Construct comprehensive log data structure
     log_data = {
@@ -606,7 +865,7 @@ def log_to_json(
         "transactionid": transaction_id,
         
         # System identification
-        "hostname": hostname,
+        "hostname": HOSTNAME,
         
         # Network information
         "client_ip": client_ip,
@@ -636,18 +895,11 @@ def log_to_json(
         # Add additional data under context key for organization
         log_data["context"] = additional_data
 
-    # Serialize to JSON string
-    json_log = json.dumps(log_data, ensure_ascii=False)
-
-    # Write to appropriate log level
-    if log_level == "ERROR":
-        json_logger.error(json_log)
-    elif log_level == "WARNING":
-        json_logger.warning(json_log)
-    elif log_level == "DEBUG":
-        json_logger.debug(json_log)
-    else:  # Default to INFO
-        json_logger.info(json_log)
+    # Serialize to JSON string (UTF-8 output, like ensure_ascii=False)
+    json_log = orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    # Write to appropriate log level (unknown names default to INFO)
+    json_logger.log(LOG_LEVELS.get(log_level, logging.INFO), json_log)
 
     return json_log, transaction_id
 
@@ -14,6 +14,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 
 # =============================================================================
@@ -210,12 +211,48 @@ STATICFILES_FINDERS = [
 # Default primary key field type for new models
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# The sudoku app ships without migration files, so test runs build its
+# tables straight from the models
+if len(sys.argv) > 1 and sys.argv[1] == "test":
+    MIGRATION_MODULES = {"sudoku": None}
+
+# =============================================================================
+# CACHE CONFIGURATION
+# =============================================================================
+
+# Shared Redis cache when REDIS_URL is provided (Django's built-in backend,
+# requires the ``redis`` package); otherwise the per-process local-memory
+# cache used for view-level stats caching
+REDIS_URL = os.environ.get("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # =============================================================================
 # SESSION CONFIGURATION
 # =============================================================================
 
-# Session management settings for user state persistence
-SESSION_ENGINE = "django.contrib.sessions.backends.db"  # Store sessions in database
+# Session management settings for user state persistence.
+# With a shared cache, session reads are served from Redis (write-through to
+# the database, so the django_session table stays authoritative). A
+# per-process local-memory cache could serve stale sessions across workers,
+# so without Redis sessions stay purely database-backed.
+if REDIS_URL:
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+    SESSION_CACHE_ALIAS = "default"
+else:
+    SESSION_ENGINE = "django.contrib.sessions.backends.db"  # Store sessions in database
 SESSION_COOKIE_AGE = 86400 * 7  # Session expires after 7 days
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True  # Session expires when browser closes
 SESSION_SAVE_EVERY_REQUEST = True  # Update session on every request